@@ -48,6 +48,7 @@ import bpy
 def discard_global_flamenco_data(_):
     job_types.discard_flamenco_data()
     comms.discard_flamenco_data()
+    manager_info.discard_flamenco_data()
 
     bpy.context.window_manager.flamenco_version_mismatch = False
 
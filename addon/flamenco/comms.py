@@ -3,13 +3,12 @@
 # <pep8 compliant>
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import bpy
 
 from flamenco import manager_info, job_types
 
-_flamenco_client = None
 _log = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
@@ -25,57 +24,89 @@ else:
     _FlamencoVersion = object
     _SharedStorageLocation = object
 
+# API clients, keyed by Manager URL. Keeping one client per Manager means its
+# urllib3 connection pool (and thus its keep-alive sockets) is reused across
+# calls, instead of paying a new TCP+TLS handshake for every request.
+_flamenco_clients: dict[str, _ApiClient] = {}
+
+# The version string of the OpenAPI client. It is constant for an installed
+# add-on, so it only has to be read (and the wheels preloaded) once.
+_flamenco_client_version: Optional[str] = None
 
-def flamenco_api_client(manager_url: str) -> _ApiClient:
-    """Returns an API client for communicating with a Manager."""
-    global _flamenco_client
 
-    if _flamenco_client is not None:
-        return _flamenco_client
+def _load_manager_module():
+    """Pre-load the wheels and import the generated API client package.
 
+    This is the single point through which the rest of this module gets to the
+    `flamenco.manager` package, so that the late-import + preload dance is not
+    repeated in every function that needs it.
+    """
     from . import dependencies
 
     dependencies.preload_modules()
 
     from . import manager
 
-    configuration = manager.Configuration(host=manager_url.rstrip("/"))
-    _flamenco_client = manager.ApiClient(configuration)
+    return manager
+
+
+def flamenco_api_client(manager_url: str) -> _ApiClient:
+    """Returns an API client for communicating with a Manager."""
+
+    host = manager_url.rstrip("/")
+    try:
+        return _flamenco_clients[host]
+    except KeyError:
+        pass
+
+    manager = _load_manager_module()
+
+    configuration = manager.Configuration(host=host)
+    # Ensure enough pooled connections that concurrent calls (like the
+    # parallel Manager info fetch) don't get serialised on a single socket.
+    # The generated default is already generous, so only apply a floor.
+    if (configuration.connection_pool_maxsize or 0) < 8:
+        configuration.connection_pool_maxsize = 8
+
+    api_client: _ApiClient = manager.ApiClient(configuration)
+    _flamenco_clients[host] = api_client
     _log.info("created API client for Manager at %s", manager_url)
 
-    return _flamenco_client
+    return api_client
 
 
 def flamenco_client_version() -> str:
     """Return the version of the Flamenco OpenAPI client."""
+    global _flamenco_client_version
 
-    from . import dependencies
-
-    dependencies.preload_modules()
-
-    from . import manager
+    if _flamenco_client_version is not None:
+        return _flamenco_client_version
 
-    return manager.__version__
+    manager = _load_manager_module()
+    _flamenco_client_version = manager.__version__
+    return _flamenco_client_version
 
 
 def discard_flamenco_data():
-    global _flamenco_client
-
-    if _flamenco_client is None:
+    if not _flamenco_clients:
         return
 
-    _log.info("closing Flamenco client")
-    _flamenco_client.close()
-    _flamenco_client = None
+    _log.info("closing Flamenco clients")
+    for api_client in _flamenco_clients.values():
+        api_client.close()
+    _flamenco_clients.clear()
 
 
 def ping_manager(
     window_manager: bpy.types.WindowManager,
     scene: bpy.types.Scene,
     api_client: _ApiClient,
+    force: bool = False,
 ) -> tuple[str, str]:
     """Fetch Manager info, and update the scene for it.
 
+    :param force: always fetch from the Manager, bypassing the freshness
+        checks on the cached info. Use for explicit 'Refresh' operations.
     :returns: tuple (report, level). The report will be something like "<name>
         version <version> found", or an error message. The level will be
         'ERROR', 'WARNING', or 'INFO', suitable for reporting via
@@ -89,7 +120,7 @@ def ping_manager(
     old_tag_name = getattr(scene, "flamenco_worker_tag", "")
 
     try:
-        info = manager_info.fetch(api_client)
+        info = manager_info.fetch(api_client, force=force)
     except manager_info.FetchError as ex:
         report = str(ex)
         window_manager.flamenco_status_ping = report
@@ -110,7 +141,11 @@ def ping_manager(
     # Since you cannot un-set an enum property, and 'empty string' is not a
     # valid value either, when the old choice is no longer available we remove
     # the underlying ID property.
-    if old_job_type_name:
+    #
+    # When the refreshed enum still resolves to the old name, the property is
+    # already correct and assigning it again would only re-trigger the update
+    # callback (and thus another property group rebuild).
+    if old_job_type_name and scene.flamenco_job_type != old_job_type_name:
         try:
             scene.flamenco_job_type = old_job_type_name
         except TypeError:  # Thrown when the old enum value no longer exists.
@@ -118,7 +153,7 @@ def ping_manager(
             report = f"Job type {old_job_type_name!r} no longer available, choose another one"
             report_level = "WARNING"
 
-    if old_tag_name:
+    if old_tag_name and scene.flamenco_worker_tag != old_tag_name:
         try:
             scene.flamenco_worker_tag = old_tag_name
         except TypeError:  # Thrown when the old enum value no longer exists.
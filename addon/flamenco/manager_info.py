@@ -3,20 +3,38 @@
 
 import dataclasses
 import json
+import mmap
+import os
 import platform
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 from urllib3.exceptions import HTTPError, MaxRetryError
 
+try:
+    # orjson is considerably faster than the stdlib json module, but is not
+    # bundled with the add-on, so only use it when it happens to be available.
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 import bpy
 
 if TYPE_CHECKING:
-    from flamenco.manager import ApiClient as _ApiClient
+    from flamenco.manager import ApiClient as _ApiClient, ApiException
+    from flamenco.manager.apis import JobsApi, MetaApi, WorkerMgtApi
+    from flamenco.manager.configuration import Configuration
+    from flamenco.manager.model_utils import OpenApiModel
     from flamenco.manager.models import (
+        AvailableJobTypes,
         AvailableJobTypes as _AvailableJobTypes,
+        FlamencoVersion,
         FlamencoVersion as _FlamencoVersion,
+        SharedStorageLocation,
         SharedStorageLocation as _SharedStorageLocation,
+        WorkerTagList,
         WorkerTagList as _WorkerTagList,
     )
 else:
@@ -26,6 +44,54 @@ else:
     _SharedStorageLocation = object
     _WorkerTagList = object
 
+# The platform name never changes while Blender is running, and
+# platform.system() is surprisingly expensive to call repeatedly.
+_PLATFORM_NAME = platform.system().lower()
+
+# Names from the generated API client that this module imports lazily, mapped
+# to the module that provides them. The generated package is huge (hundreds of
+# model modules), so it should only be imported when actually used.
+_API_IMPORTS = {
+    "ApiException": "flamenco.manager",
+    "JobsApi": "flamenco.manager.apis",
+    "MetaApi": "flamenco.manager.apis",
+    "WorkerMgtApi": "flamenco.manager.apis",
+    "Configuration": "flamenco.manager.configuration",
+    "OpenApiModel": "flamenco.manager.model_utils",
+    "AvailableJobTypes": "flamenco.manager.models",
+    "FlamencoVersion": "flamenco.manager.models",
+    "SharedStorageLocation": "flamenco.manager.models",
+    "WorkerTagList": "flamenco.manager.models",
+}
+
+
+def _import_api_names() -> None:
+    """Import the lazy API names into the module globals.
+
+    The first call runs the actual imports; after that the names are plain
+    module globals and this function returns after a single dict lookup.
+    """
+    if "ApiException" in globals():
+        return
+
+    import importlib
+
+    for name, module_path in _API_IMPORTS.items():
+        globals()[name] = getattr(importlib.import_module(module_path), name)
+
+
+def __getattr__(name: str) -> Any:
+    """PEP 562 lazy access to the generated API client names."""
+    if name not in _API_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _import_api_names()
+    return globals()[name]
+
+
+# Memoized result of ManagerInfo.type_info(). functools.cached_property does
+# not apply to a staticmethod, so this module global serves the same purpose.
+_cached_type_info: Optional[dict[str, type]] = None
+
 
 @dataclasses.dataclass
 class ManagerInfo:
@@ -42,22 +108,20 @@ class ManagerInfo:
 
     @staticmethod
     def type_info() -> dict[str, type]:
-        # Do a late import, so that the API is only imported when actually used.
-        from flamenco.manager.models import (
-            AvailableJobTypes,
-            FlamencoVersion,
-            SharedStorageLocation,
-            WorkerTagList,
-        )
+        global _cached_type_info
 
-        # These types cannot be obtained by introspecting the ManagerInfo class, as
-        # at runtime that doesn't use real type annotations.
-        return {
-            "flamenco_version": FlamencoVersion,
-            "shared_storage": SharedStorageLocation,
-            "job_types": AvailableJobTypes,
-            "worker_tags": WorkerTagList,
-        }
+        if _cached_type_info is None:
+            _import_api_names()
+
+            # These types cannot be obtained by introspecting the ManagerInfo
+            # class, as at runtime that doesn't use real type annotations.
+            _cached_type_info = {
+                "flamenco_version": FlamencoVersion,
+                "shared_storage": SharedStorageLocation,
+                "job_types": AvailableJobTypes,
+                "worker_tags": WorkerTagList,
+            }
+        return _cached_type_info
 
 
 class FetchError(RuntimeError):
@@ -70,31 +134,65 @@ class LoadError(RuntimeError):
 
 _cached_manager_info: Optional[ManagerInfo] = None
 
+# Monotonic timestamp of the last successful fetch() from the Manager, and the
+# host that fetch talked to. Within _CACHE_TTL seconds of that, fetch() returns
+# the cached info for the same host without any HTTP traffic; after that it
+# revalidates with a single version call before doing a full re-fetch.
+_cached_fetched_at: float = 0.0
+_cached_for_host: str = ""
+_CACHE_TTL = 30.0
 
-def fetch(api_client: _ApiClient) -> ManagerInfo:
-    global _cached_manager_info
 
-    # Do a late import, so that the API is only imported when actually used.
-    from flamenco.manager import ApiException
-    from flamenco.manager.apis import MetaApi, JobsApi, WorkerMgtApi
-    from flamenco.manager.models import (
-        AvailableJobTypes,
-        FlamencoVersion,
-        SharedStorageLocation,
-        WorkerTagList,
-    )
+def fetch(api_client: _ApiClient, force: bool = False) -> ManagerInfo:
+    global _cached_manager_info, _cached_fetched_at, _cached_for_host
+
+    host: str = api_client.configuration.host
+
+    if (
+        not force
+        and _cached_manager_info is not None
+        and _cached_for_host == host
+        and time.monotonic() - _cached_fetched_at < _CACHE_TTL
+    ):
+        return _cached_manager_info
+
+    _import_api_names()
 
     meta_api = MetaApi(api_client)
     jobs_api = JobsApi(api_client)
     worker_mgt_api = WorkerMgtApi(api_client)
 
+    if not force and _cached_manager_info is not None and _cached_for_host == host:
+        # The TTL expired, but the cache may still be valid. Revalidate with a
+        # single cheap version call; only a version change warrants re-fetching
+        # the job types and worker tags.
+        try:
+            remote_version = meta_api.get_version()
+        except (ApiException, MaxRetryError, HTTPError):
+            # Fall through to the full fetch, which has the proper error
+            # handling and reporting.
+            pass
+        else:
+            cached_version = _cached_manager_info.flamenco_version.version
+            if remote_version.version == cached_version:
+                _cached_fetched_at = time.monotonic()
+                return _cached_manager_info
+
     try:
-        flamenco_version: FlamencoVersion = meta_api.get_version()
-        shared_storage: SharedStorageLocation = meta_api.get_shared_storage(
-            "users", platform.system().lower()
-        )
-        job_types: AvailableJobTypes = jobs_api.get_job_types()
-        worker_tags: WorkerTagList = worker_mgt_api.fetch_worker_tags()
+        # The four calls are independent, so overlap them; the total wait is
+        # then the slowest round-trip instead of the sum of all four.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            version_future = executor.submit(meta_api.get_version)
+            storage_future = executor.submit(
+                meta_api.get_shared_storage, "users", _PLATFORM_NAME
+            )
+            job_types_future = executor.submit(jobs_api.get_job_types)
+            worker_tags_future = executor.submit(worker_mgt_api.fetch_worker_tags)
+
+            flamenco_version: FlamencoVersion = version_future.result()
+            shared_storage: SharedStorageLocation = storage_future.result()
+            job_types: AvailableJobTypes = job_types_future.result()
+            worker_tags: WorkerTagList = worker_tags_future.result()
     except ApiException as ex:
         raise FetchError("Manager cannot be reached: %s" % ex) from ex
     except MaxRetryError as ex:
@@ -111,96 +209,206 @@ def fetch(api_client: _ApiClient) -> ManagerInfo:
         job_types=job_types,
         worker_tags=worker_tags,
     )
+    _cached_fetched_at = time.monotonic()
+    _cached_for_host = host
     return _cached_manager_info
 
 
-class Encoder(json.JSONEncoder):
-    def default(self, o):
-        from flamenco.manager.model_utils import OpenApiModel
-
-        if isinstance(o, OpenApiModel):
-            return o.to_dict()
-
-        if isinstance(o, ManagerInfo):
-            # dataclasses.asdict() creates a copy of the OpenAPI models,
-            # in a way that just doesn't work, hence this workaround.
-            return {f.name: getattr(o, f.name) for f in dataclasses.fields(o)}
+def _openapi_model_as_dict(o: "OpenApiModel") -> dict[str, Any]:
+    as_dict: dict[str, Any] = o.to_dict()
+    return as_dict
 
-        return super().default(o)
 
+def _manager_info_as_dict(o: ManagerInfo) -> dict[str, Any]:
+    # dataclasses.asdict() creates a copy of the OpenAPI models,
+    # in a way that just doesn't work, hence this workaround.
+    return {f.name: getattr(o, f.name) for f in dataclasses.fields(o)}
 
-def _to_json(info: ManagerInfo) -> str:
-    return json.dumps(info, indent="  ", cls=Encoder)
 
+class Encoder(json.JSONEncoder):
+    # Handlers per concrete type, filled as types are encountered. This way
+    # the isinstance() checks (and the API import) only run once per type,
+    # and every subsequent value of that type is a single dict lookup away
+    # from its handler.
+    _type_handlers: dict[type, Callable[[Any], dict[str, Any]]] = {}
 
-def _from_json(contents: Union[str, bytes]) -> ManagerInfo:
-    # Do a late import, so that the API is only imported when actually used.
-    from flamenco.manager.configuration import Configuration
-    from flamenco.manager.model_utils import validate_and_convert_types
-
-    json_dict = json.loads(contents)
+    def default(self, o):
+        handlers = Encoder._type_handlers
+        try:
+            handler = handlers[type(o)]
+        except KeyError:
+            _import_api_names()
+            if isinstance(o, OpenApiModel):
+                handler = handlers[type(o)] = _openapi_model_as_dict
+            elif isinstance(o, ManagerInfo):
+                handler = handlers[type(o)] = _manager_info_as_dict
+            else:
+                return super().default(o)
+        return handler(o)
+
+
+def _from_json(contents: Union[str, bytes, mmap.mmap]) -> ManagerInfo:
+    _import_api_names()
+
+    if orjson is not None:
+        # orjson parses any buffer via memoryview, without copying it first.
+        # The view has to be released even when parsing fails, as otherwise a
+        # reference held by the propagating exception's traceback prevents
+        # load() from closing the mmap (raising BufferError instead).
+        if isinstance(contents, mmap.mmap):
+            with memoryview(contents) as view:
+                json_dict = orjson.loads(view)
+        else:
+            json_dict = orjson.loads(contents)
+    else:
+        # The stdlib parser only accepts str/bytes/bytearray.
+        if isinstance(contents, mmap.mmap):
+            contents = bytes(contents)
+        json_dict = json.loads(contents)
     dummy_cfg = Configuration()
     api_models = {}
 
     for name, api_type in ManagerInfo.type_info().items():
-        api_model = validate_and_convert_types(
-            json_dict[name],
-            (api_type,),
-            [name],
-            True,
-            True,
-            dummy_cfg,
+        # Construct the models directly, instead of going through the generic
+        # validate_and_convert_types() dispatcher. Type checking has to stay
+        # enabled: it is also what makes the model convert nested dicts and
+        # lists into their model classes.
+        api_model = api_type._new_from_openapi_data(  # type: ignore[attr-defined]
+            **json_dict[name],
+            _check_type=True,
+            _path_to_item=[name],
+            _spec_property_naming=True,
+            _configuration=dummy_cfg,
         )
         api_models[name] = api_model
 
     return ManagerInfo(**api_models)
 
 
+_cached_json_filepath: Optional[Path] = None
+
+
 def _json_filepath() -> Path:
-    # This is the '~/.config/blender/{version}' path.
-    user_path = Path(bpy.utils.resource_path(type="USER"))
-    return user_path / "config" / "flamenco-manager-info.json"
+    global _cached_json_filepath
+
+    # The resource path is constant for a Blender session, so resolve it once.
+    if _cached_json_filepath is None:
+        # This is the '~/.config/blender/{version}' path.
+        user_path = Path(bpy.utils.resource_path(type="USER"))
+        _cached_json_filepath = user_path / "config" / "flamenco-manager-info.json"
+    return _cached_json_filepath
 
 
 def save(info: ManagerInfo) -> None:
+    global _cached_json_mtime
+
     json_path = _json_filepath()
     json_path.parent.mkdir(parents=True, exist_ok=True)
 
-    as_json = _to_json(info)
-    json_path.write_text(as_json, encoding="utf8")
+    # Write to a temporary file first, then atomically rename it over the
+    # real one, so that a crash mid-write cannot leave a truncated cache.
+    tmp_path = json_path.with_suffix(".json~")
+
+    if orjson is not None:
+        # orjson cannot stream, but it serialises to a compact bytes object
+        # much faster than the stdlib can.
+        as_bytes = orjson.dumps(
+            info, default=Encoder().default, option=orjson.OPT_INDENT_2
+        )
+        tmp_path.write_bytes(as_bytes)
+    else:
+        # Stream the JSON to disk chunk by chunk, instead of first building
+        # the entire document as one big string in memory.
+        with tmp_path.open("w", encoding="utf8") as json_file:
+            json.dump(info, json_file, indent="  ", cls=Encoder)
+
+    os.replace(tmp_path, json_path)
+
+    if info is _cached_manager_info:
+        # The file on disk now reflects the in-memory cache, so a subsequent
+        # load() does not have to parse it again.
+        _cached_json_mtime = json_path.stat().st_mtime
+
+
+# Modification time of the JSON file the in-memory cache was parsed from, so
+# that an unchanged file does not get parsed again.
+_cached_json_mtime: float = 0.0
 
 
 def load() -> ManagerInfo:
+    global _cached_json_mtime
+
     json_path = _json_filepath()
     if not json_path.exists():
         raise FileNotFoundError(f"{json_path.name} not found in {json_path.parent}")
 
     try:
-        as_json = json_path.read_text(encoding="utf8")
+        json_mtime = json_path.stat().st_mtime
+        if _cached_manager_info is not None and json_mtime == _cached_json_mtime:
+            # The file is unchanged since it was last parsed, so the in-memory
+            # cache is still an accurate reflection of it.
+            return _cached_manager_info
+
+        json_file = json_path.open("rb")
     except OSError as ex:
         raise LoadError(f"Could not read {json_path}: {ex}") from ex
 
-    try:
-        return _from_json(as_json)
-    except json.JSONDecodeError as ex:
-        raise LoadError(f"Could not decode JSON in {json_path}") from ex
+    with json_file:
+        try:
+            # Map the file into memory instead of copying it into a Python
+            # string first; the JSON parser reads straight from the buffer.
+            contents: Union[bytes, mmap.mmap] = mmap.mmap(
+                json_file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+        except (ValueError, OSError):
+            # Zero-length files (and exotic filesystems) cannot be mapped.
+            contents = json_file.read()
+
+        try:
+            info = _from_json(contents)
+        except json.JSONDecodeError as ex:
+            raise LoadError(f"Could not decode JSON in {json_path}") from ex
+        finally:
+            if isinstance(contents, mmap.mmap):
+                contents.close()
+
+    _cached_json_mtime = json_mtime
+    return info
 
 
 def load_into_cache() -> Optional[ManagerInfo]:
     global _cached_manager_info
 
-    _cached_manager_info = None
     try:
         _cached_manager_info = load()
     except FileNotFoundError:
+        _cached_manager_info = None
         return None
     except LoadError as ex:
+        _cached_manager_info = None
         print(f"Could not load Flamenco Manager info from disk: {ex}")
         return None
 
     return _cached_manager_info
 
 
+def discard_flamenco_data() -> None:
+    """Forget the in-memory Manager info cache.
+
+    The next load() or fetch() will go back to the disk cache or the Manager.
+    Note that the session caches are kept in plain module globals on purpose:
+    nothing else holds a strong reference to the cached objects, so a
+    weakref-based registry would discard them right after every fetch.
+    """
+    global _cached_manager_info, _cached_fetched_at, _cached_for_host
+    global _cached_json_mtime
+
+    _cached_manager_info = None
+    _cached_fetched_at = 0.0
+    _cached_for_host = ""
+    _cached_json_mtime = 0.0
+
+
 def load_cached() -> Optional[ManagerInfo]:
     global _cached_manager_info
 
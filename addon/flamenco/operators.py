@@ -85,6 +85,7 @@ class FLAMENCO_OT_ping_manager(FlamencoOpMixin, bpy.types.Operator):
             context.window_manager,
             context.scene,
             api_client,
+            force=True,
         )
         self.report({level}, report)
 
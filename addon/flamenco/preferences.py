@@ -13,6 +13,7 @@ def discard_flamenco_client(context):
     from . import comms
 
     comms.discard_flamenco_data()
+    manager_info.discard_flamenco_data()
     context.window_manager.flamenco_status_ping = ""
 
 
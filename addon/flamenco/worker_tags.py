@@ -9,12 +9,18 @@ from . import manager_info
 
 _enum_items: list[Union[tuple[str, str, str], tuple[str, str, str, int, int]]] = []
 
+# The WorkerTagList the enum items were built from. Blender calls the items
+# callback very often (on every redraw of the dropdown), so only rebuild the
+# list when the worker tags themselves were replaced by a refresh.
+_enum_items_source: object = None
+
 
 def _get_enum_items(self, context):
-    global _enum_items
+    global _enum_items, _enum_items_source
 
     manager = manager_info.load_cached()
     if manager is None:
+        _enum_items_source = None
         _enum_items = [
             (
                 "-",
@@ -24,11 +30,18 @@ def _get_enum_items(self, context):
         ]
         return _enum_items
 
+    if manager.worker_tags is _enum_items_source:
+        return _enum_items
+
+    # Convert from API response type to list suitable for an EnumProperty.
     _enum_items = [
-        ("-", "All", "No specific tag assigned, any worker can handle this job"),
+        (tag.id, tag.name, getattr(tag, "description", ""))
+        for tag in manager.worker_tags.tags
     ]
-    for tag in manager.worker_tags.tags:
-        _enum_items.append((tag.id, tag.name, getattr(tag, "description", "")))
+    _enum_items.insert(
+        0, ("-", "All", "No specific tag assigned, any worker can handle this job")
+    )
+    _enum_items_source = manager.worker_tags
 
     return _enum_items
 